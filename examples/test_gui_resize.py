@@ -36,7 +36,11 @@ def handle_resize():
     new_size = window_surface.get_size()
     print(f'NEW SIZE: {new_size}')
     manager.set_window_resolution(new_size)
-    background_surface = pygame.Surface(new_size)
+    # only allocate a new background when the window has outgrown the current one
+    bg_width, bg_height = background_surface.get_size()
+    if new_size[0] > bg_width or new_size[1] > bg_height:
+        background_surface = pygame.Surface((max(bg_width, int(new_size[0] * 1.25)),
+                                             max(bg_height, int(new_size[1] * 1.25))))
 
 
 # layout calculation variables
@@ -173,10 +177,10 @@ while is_running:
             manager.set_visual_debug_mode(DEBUG_MODE)
 
         manager.process_events(event)
-    background_surface.fill(BACKGROUND_FILL_COLOR)
+    background_surface.fill(BACKGROUND_FILL_COLOR, window_surface.get_rect())
     manager.update(time_delta)
 
-    window_surface.blit(background_surface, (0, 0))
+    window_surface.blit(background_surface, (0, 0), window_surface.get_rect())
     manager.draw_ui(window_surface)
 
     pygame.display.update()
@@ -19,14 +19,14 @@ def thread_launcher(**kwargs):
 
     thread_running = True
     while thread_running:
-        if not queue.empty():
-            task = queue.get()
-            cmd = task.get('command')
-            print(f'got task: {task["command"]}')
-            if cmd == 'quit':
-                thread_running = False
-            if cmd == 'increment':
-                obj.increment_clicks()
+        # block until there is work rather than spinning on queue.empty()
+        task = queue.get(block=True)
+        cmd = task.get('command')
+        print(f'got task: {task["command"]}')
+        if cmd == 'quit':
+            thread_running = False
+        if cmd == 'increment':
+            obj.increment_clicks()
 
 
 margin = 5
@@ -59,6 +59,8 @@ class ThreadTestApp(GuiApp):
         )
 
         self._click_count = 0
+        self._click_count_lock = threading.Lock()
+        self._displayed_click_count = self._click_count
         rr = pygame.Rect((margin, self._button.rect.bottom + margin), (-1, -1))
         print(f'rr: {rr}')
         self._status = UILabel(
@@ -79,9 +81,18 @@ class ThreadTestApp(GuiApp):
         self._worker_thread.start()
 
     def increment_clicks(self):
-        # this gets called from threads. Should probably use critical section
-        self._click_count += 1
-        self._status.set_text(f'Clicks: {self._click_count}')
+        # this gets called from the worker thread, so only count the click here. The label
+        # is updated from the main thread in `update`.
+        with self._click_count_lock:
+            self._click_count += 1
+
+    def update(self, time_delta: float):
+        super().update(time_delta)
+        with self._click_count_lock:
+            click_count = self._click_count
+        if click_count != self._displayed_click_count:
+            self._displayed_click_count = click_count
+            self._status.set_text(f'Clicks: {click_count}')
 
     def on_shutdown(self):
         self._worker_queue.put({'command': 'quit'})
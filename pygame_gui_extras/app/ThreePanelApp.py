@@ -46,10 +46,11 @@ class ThreePanelApp(GuiApp):
         self._margins = margins
         self._top_height = top_height
         self._bottom_height = bottom_height
-        window_height = self.root_window_surface.get_height()
-        window_width = self.root_window_surface.get_width()
-        _top_height = window_height * top_height if heights_as_fractions else top_height
-        _bottom_height = window_height * bottom_height if heights_as_fractions else bottom_height
+        # Fractions of the window height, kept so the panels can be resized with the window
+        self._top_fraction = top_height if heights_as_fractions else None
+        self._bottom_fraction = bottom_height if heights_as_fractions else None
+        window_width, window_height = self.root_window_surface.get_size()
+        _top_height, _bottom_height = self._panel_heights(window_height)
         _middle_height = window_height - _top_height - _bottom_height
         layer = 1
         if _middle_height <= 0:
@@ -77,7 +78,7 @@ class ThreePanelApp(GuiApp):
             }
         )
         self._middle_panel = UIPanel(
-            pygame.Rect(0, 0, window_width, window_height - (_top_height + _bottom_height)), layer,
+            pygame.Rect(0, 0, window_width, _middle_height), layer,
             self.ui_manager,
             margins=margins,
             anchors={
@@ -90,6 +91,37 @@ class ThreePanelApp(GuiApp):
             }
         )
 
+    def _panel_heights(self, window_height: int):
+        """
+        Calculate the heights of the top and bottom panels for the given window height.
+        :return: (top height, bottom height)
+        """
+        if self._top_fraction is None:
+            return self._top_height, self._bottom_height
+        return window_height * self._top_fraction, window_height * self._bottom_fraction
+
+    def recompute_panels(self):
+        """
+        Resize the panels to fit the current window size.
+
+        Panels specified as fractions of the window height keep their fractions. Panels specified in
+        pixels already follow the window through their anchors, so there is nothing to do for them.
+        Called automatically when the window is resized.
+        """
+        if self._top_fraction is None:
+            return
+        window_width, window_height = self.size
+        top_height, bottom_height = self._panel_heights(window_height)
+        self._top_panel.set_dimensions((self._top_panel.rect.width, top_height))
+        self._bottom_panel.set_relative_position((0, -bottom_height))
+        self._bottom_panel.set_dimensions((self._bottom_panel.rect.width, bottom_height))
+        self._middle_panel.set_dimensions((self._middle_panel.rect.width,
+                                           window_height - top_height - bottom_height))
+
+    def on_resize(self, size):
+        super().on_resize(size)
+        self.recompute_panels()
+
     @property
     def top_panel(self):
         """
@@ -10,6 +10,9 @@ from abc import ABCMeta, abstractmethod
 class IUpdateObject(metaclass=ABCMeta):
     """
     Metaclass for defining objects that can be updated.
+
+    Deriving from this class is optional. :func:`GuiApp.add_update_object` accepts any object
+    with an ``update(time_delta)`` method.
     """
     @abstractmethod
     def update(self, time_delta: float):
@@ -65,8 +68,11 @@ class GuiApp:
             app.setup()
             app.run()
     """
+    # Colour of the root window behind the UI elements. Override in a subclass to change it.
+    BACKGROUND_COLOR = '#303030'
 
-    def __init__(self, window_size, framerate: int = 60, title: str = None, resizeable=True):
+    def __init__(self, window_size, framerate: int = 60, title: str = None, resizeable=True,
+                 lazy_redraw: bool = False):
         """
         Create an instance of GuiApp
 
@@ -75,8 +81,19 @@ class GuiApp:
             title:   Title of the window which is display in the frame of the application.
             resizeable: Whether the window created for the application should be resizable. Defaults to True.
             framerate: Speed at which updates occur. Unit: FPS. Default: 60
+            lazy_redraw: Only redraw the window on frames where something may have changed: there
+                were events, the set of UI elements changed, an update object's ``update`` returned
+                True or :func:`mark_dirty` was called. UI changes made any other way (timed pygame_gui
+                effects such as a blinking text cursor, or ``set_text`` from ``update``) will not be
+                shown until the next redraw, so call :func:`mark_dirty` after making them.
+                ``UIImageTiled`` posts a ``UI_IMAGE_TILED_UPDATED`` event when its background-built
+                image is ready, so resized tiled images are redrawn without any extra work.
+                Defaults to False, which redraws every frame.
         """
         self._framerate = framerate
+        self._lazy_redraw = lazy_redraw
+        self._dirty = True
+        self._ui_sprite_count = 0
         self.title = title
         pygame.init()
         if title:
@@ -90,12 +107,15 @@ class GuiApp:
             flags |= pygame.RESIZABLE
         self.root_window_surface = pygame.display.set_mode(window_size, flags)
 
+        self._bg_color = pygame.Color(self.BACKGROUND_COLOR)
         self.background_surface = pygame.Surface(self.size).convert()
-        self.background_surface.fill(pygame.Color('#303030'))
+        self.background_surface.fill(self._bg_color)
+        self._bg_capacity = self.size
+        self._last_size = self.size
         self._ui_manager = UIManager(self.size)
         self.clock = pygame.time.Clock()
         self.is_running = False
-        self._update_objects = []
+        self._update_callbacks = []
 
     def setup(self):
         """
@@ -113,8 +133,11 @@ class GuiApp:
         Helper function that registers an object to be updated via the `main_loop`. This lets
         you create objects with an `update` function and register them with the application so
         that they get updated automatically via the applications `main_loop`.
+
+        The object's bound `update` method is looked up once, here, rather than on every frame.
+        If it returns True the window is marked dirty (see `lazy_redraw`).
         """
-        self._update_objects.append(update_object)
+        self._update_callbacks.append(update_object.update)
 
     def update(self, time_delta: float):
         """
@@ -125,13 +148,23 @@ class GuiApp:
         objects.
 
         This is done by calling ``update(time_delta)`` on each of the registered
-        IUpdatableObject instances.
+        update objects.
 
         Parameters:
             time_delta:float: Fractional seconds that have passed since the last update.
         """
-        for obj in self._update_objects:
-            obj.update(time_delta)
+        for update_callback in self._update_callbacks:
+            if update_callback(time_delta):
+                self._dirty = True
+
+    def mark_dirty(self):
+        """
+        Make sure the window is redrawn on the next pass through the `main_loop`.
+
+        Only needed when `lazy_redraw` is enabled and the user interface was changed without
+        an event, for example by calling ``set_text`` on a label from ``update``.
+        """
+        self._dirty = True
 
     def handle_event(self, event):
         """
@@ -152,6 +185,16 @@ class GuiApp:
         """
         return False
 
+    def on_resize(self, size):
+        """
+        Called once per frame after the window has been resized, once the background and the
+        UIManager have been updated for the new size. Override to adjust your layout.
+
+        Parameters:
+            size: The new size of the root window.
+        """
+        pass
+
     def on_shutdown(self):
         """
         Called when app is shutting down. Override with application specific clean up.
@@ -192,42 +235,91 @@ class GuiApp:
         1. Calculates the time_delta which can be used for animations, etc
         2. Calls ``update_application_data``. Override this function to update application specific data.
         3. For each event in the pygame event queue:
-            3.1. Handles generic application / window events
+            3.1. Handles generic application / window events. These are taken from the queue ahead of
+                all other events. Window resizes are applied once, after all events have been processed.
             3.2. calls ``handle_event`` passing in any unprocessed events. Override this function to handle application
                 specific events.
             3.3 Passes any unprocessed events to the UIManager.
         4. Updates the UIManager with the current time_delta
-        5. Updates the Display
+        5. Updates the Display. With `lazy_redraw` this is skipped when nothing has marked the window dirty.
 
         If you override :func:`.update` and :func:`.handle_event` you should not need to override this
         function.
         """
         time_delta = self.clock.tick(self.framerate) / 1000.0
 
-        for event in pygame.event.get():
+        # Window managers send a stream of resize events while the window is dragged, only
+        # act on the last one each frame.
+        pending_resize = None
+        # Pump once so both reads below see the same queue. Letting the second get() pump would pull
+        # in QUIT / WINDOWRESIZED events that arrived after the first one and skip their handling.
+        pygame.event.pump()
+        for event in pygame.event.get(eventtype=(pygame.QUIT, pygame.WINDOWRESIZED), pump=False):
             if event.type == pygame.QUIT:
                 self.on_shutdown()
                 self.is_running = False
-            elif event.type == pygame.WINDOWRESIZED:
-                self.background_surface = pygame.Surface(self.size).convert()
-                self.background_surface.fill(pygame.Color('#303030'))
-                self.ui_manager.set_window_resolution(self.size)
-            else:
-                self.handle_event(event)
-            if self.is_running:
-                self._ui_manager.process_events(event)
+                break
+            pending_resize = self.size
+            self._ui_manager.process_events(event)
 
         if not self.is_running:
+            # shutting down, leave the remaining events unprocessed
             return
 
+        events = pygame.event.get(pump=False)
+        for event in events:
+            self.handle_event(event)
+            if not self.is_running:
+                # handle_event stopped the app, don't dispatch, update or draw anything more
+                return
+            self._ui_manager.process_events(event)
+
+        if events or pending_resize is not None:
+            self._dirty = True
+
+        if pending_resize is not None and pending_resize != self._last_size:
+            self._resize_background(pending_resize)
+            self.ui_manager.set_window_resolution(pending_resize)
+            self._last_size = pending_resize
+            self.on_resize(pending_resize)
+
         self._ui_manager.update(time_delta)
         self.update(time_delta)
 
-        self.root_window_surface.blit(self.background_surface, (0, 0))
+        if self._lazy_redraw:
+            # elements appearing or going away without an event, e.g. tool tips
+            ui_sprite_count = len(self._ui_manager.get_sprite_group())
+            if ui_sprite_count != self._ui_sprite_count:
+                self._ui_sprite_count = ui_sprite_count
+                self._dirty = True
+            if not self._dirty:
+                return
+        self._dirty = False
+
+        self.root_window_surface.blit(self.background_surface, (0, 0), pygame.Rect((0, 0), self.size))
         self._ui_manager.draw_ui(self.root_window_surface)
 
         pygame.display.update()
 
+    def _resize_background(self, size):
+        """
+        Make sure the background surface covers a window of the given size.
+
+        The background is a flat colour, so the existing surface is reused while the window fits
+        inside it. When the window grows past it a new, somewhat larger, surface is allocated so
+        that a window being dragged bigger does not need a new surface for every resize.
+
+        Parameters:
+            size: The new size of the root window.
+        """
+        width, height = size
+        capacity_width, capacity_height = self._bg_capacity
+        if width <= capacity_width and height <= capacity_height:
+            return
+        self._bg_capacity = (max(capacity_width, int(width * 1.25)), max(capacity_height, int(height * 1.25)))
+        self.background_surface = pygame.Surface(self._bg_capacity).convert()
+        self.background_surface.fill(self._bg_color)
+
     def run(self):
         """
         Run the app by continuously calling the main_loop
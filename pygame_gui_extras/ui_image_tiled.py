@@ -1,3 +1,6 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Tuple, Dict
 
 import pygame
@@ -7,6 +10,13 @@ from pygame_gui.core.interfaces import IContainerLikeInterface, IUIManagerInterf
 from pygame_gui.core import UIElement
 from pygame_gui.core.utility import premul_alpha_surface
 
+# Builds resized tiled images off the UI thread. A single worker keeps the builds in order.
+_tiling_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='UIImageTiled')
+
+# Posted when a UIImageTiled swaps in an image built by the worker. Nothing else changes on screen
+# at that moment, so apps that only redraw after events (e.g. GuiApp with lazy_redraw) rely on it.
+UI_IMAGE_TILED_UPDATED = pygame.event.custom_type()
+
 
 class UIImageTiled(UIElement):
     """
@@ -25,6 +35,9 @@ class UIImageTiled(UIElement):
     :param visible: Whether the element is visible by default. Warning - container visibility
                     may override this.
     """
+    # Number of tiled surfaces kept around for previously seen panel sizes.
+    TILED_CACHE_SIZE = 4
+
     def __init__(self,
                  relative_rect: pygame.Rect,
                  image_surface: pygame.surface.Surface,
@@ -47,29 +60,126 @@ class UIImageTiled(UIElement):
                                element_id='image')
 
         self.original_image = None
+        # Tiled surfaces keyed on (panel_width, panel_height, id(tile)), least recently used first.
+        self._tiled_cache = OrderedDict()
+        # _build_tiled_image runs on the tiling worker as well as the UI thread
+        self._tiled_cache_lock = threading.Lock()
+        # Future for a tiled image being built by the worker after a resize
+        self._pending_image = None
         # GUI images must support an alpha channel & must have their alpha channel pre-multiplied
-        # with their colours.
+        # with their colours. The tile is pre-multiplied once here, so the tiled surfaces built from
+        # it already are.
         self._tile = image_surface
-        image_surface = self.create_tiled_surface()
-        image_surface = premul_alpha_surface(image_surface.convert_alpha())
-        if (image_surface.get_width() != self.rect.width or
-                image_surface.get_height() != self.rect.height):
-            self.original_image = image_surface
-            self.set_image(pygame.transform.smoothscale(self.original_image, self.rect.size))
-        else:
-            self.set_image(image_surface)
+        self._tile_pm = premul_alpha_surface(image_surface.convert_alpha())
+        # Panel size the current image was tiled for. The tiled surface always matches the
+        # element's size, so it never needs scaling.
+        self._tiled_size = self.rect.size
+        self.set_image(self.create_tiled_surface())
+
+    def set_tile(self, image_surface: pygame.surface.Surface):
+        """
+        Replace the tile image, dropping any cached tiled surfaces built from the old tile.
+
+        :param image_surface: The new pygame surface to tile across the element.
+
+        """
+        if image_surface is self._tile:
+            return
+        if self._pending_image is not None:
+            # whatever the worker is building uses the old tile
+            self._pending_image.cancel()
+            self._pending_image = None
+        self._tile = image_surface
+        self._tile_pm = None if image_surface is None else premul_alpha_surface(image_surface.convert_alpha())
+        with self._tiled_cache_lock:
+            self._tiled_cache.clear()
+        self.original_image = self.create_tiled_surface()
+        self._tiled_size = self.rect.size
+        self.set_image(self.original_image)
+
+    def create_tiled_surface(self, size: Union[Tuple[int, int], None] = None):
+        """
+        Tile the pre-multiplied tile across a surface of exactly the panel's size. Tiles on the
+        right and bottom edges are cut off rather than rounding the surface size up.
 
-    def create_tiled_surface(self):
-        if self._tile is None:
-            return self._tile
-        panel_width, panel_height = self.rect.size
-        tile_width, tile_height = self._tile.get_height(), self._tile.get_width()
+        :param size: The panel size to tile for. Defaults to the element's current size.
+
+        """
+        return self._build_tiled_image(self.rect.size if size is None else size, self._tile, self._tile_pm)
+
+    def _cached_tiled_surface(self, size: Tuple[int, int],
+                              tile: pygame.surface.Surface) -> Union[pygame.surface.Surface, None]:
+        """
+        Look up a previously built tiled surface, marking it as the most recently used.
+
+        :param size: The panel size the surface was built for.
+        :param tile: The tile the surface was built from.
+
+        :return: The cached surface, or None if there isn't one.
+
+        """
+        key = (size[0], size[1], id(tile))
+        with self._tiled_cache_lock:
+            cached_surface = self._tiled_cache.get(key)
+            if cached_surface is not None:
+                self._tiled_cache.move_to_end(key)
+            return cached_surface
+
+    def _build_tiled_image(self, size: Tuple[int, int],
+                           tile: pygame.surface.Surface,
+                           tile_pm: pygame.surface.Surface) -> pygame.surface.Surface:
+        """
+        Does the work of create_tiled_surface. The tile is passed in rather than read from the
+        element, so a build already running on the tiling worker keeps using the tile it was
+        submitted with if `set_tile` is called meanwhile.
+
+        :param size: The size of the element the image is being built for.
+        :param tile: The tile, used to key the cache.
+        :param tile_pm: The pre-multiplied copy of `tile` that actually gets tiled.
+
+        """
+        if tile_pm is None:
+            return tile_pm
+        cached_surface = self._cached_tiled_surface(size, tile)
+        if cached_surface is not None:
+            return cached_surface
+        panel_width, panel_height = size
+        key = (panel_width, panel_height, id(tile))
+        tile_width, tile_height = tile_pm.get_width(), tile_pm.get_height()
         if panel_width == tile_width and panel_height == tile_height:
-            return self._tile
-        new_surface = pygame.Surface((panel_width, panel_height))
-        for y in range(0, panel_height, tile_height):
-            for x in range(0,panel_width, tile_width):
-                new_surface.blit(self._tile, (x, y))
+            return tile_pm
+        # Allocated with per-pixel alpha from the start, so it never needs a convert_alpha() pass
+        new_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA, 32)
+        if tile_width <= 0 or tile_height <= 0:
+            # nothing to tile, the panel stays transparent
+            return new_surface
+        if tile_width >= panel_width and tile_height >= panel_height:
+            # a single tile covers the whole panel, just copy the part that shows
+            new_surface.blit(tile_pm, (0, 0), pygame.Rect(0, 0, panel_width, panel_height))
+        else:
+            # Blit the tile once, then keep copying everything filled so far next to itself. This
+            # doubles the filled area with each blit, first across the top row and then down, so
+            # the number of blits grows with log2 of the panel / tile ratio and no list of tile
+            # positions is ever built, however small the tile.
+            new_surface.blit(tile_pm, (0, 0))
+            filled_width = tile_width
+            while filled_width < panel_width:
+                new_surface.blit(new_surface, (filled_width, 0),
+                                 pygame.Rect(0, 0, min(filled_width, panel_width - filled_width), tile_height))
+                filled_width *= 2
+            filled_height = tile_height
+            while filled_height < panel_height:
+                new_surface.blit(new_surface, (0, filled_height),
+                                 pygame.Rect(0, 0, panel_width, min(filled_height, panel_height - filled_height)))
+                filled_height *= 2
+        with self._tiled_cache_lock:
+            # Only cache surfaces of the current tile. set_tile clears the cache under this lock after
+            # replacing the tile, so the cache never holds an entry for a tile that may have been freed
+            # and had its id reused.
+            if tile is self._tile:
+                self._tiled_cache[key] = new_surface
+                if len(self._tiled_cache) > self.TILED_CACHE_SIZE:
+                    self._tiled_cache.popitem(last=False)
         return new_surface
 
     def set_dimensions(self, dimensions: Union[pygame.math.Vector2,
@@ -81,15 +191,47 @@ class UIImageTiled(UIElement):
         :param dimensions: The new dimensions of the image.
 
         """
+        old_size = self.rect.size
         super().set_dimensions(dimensions)
+        if self.rect.size == old_size and self.image is not None:
+            return
 
-        if self.rect.size != self.image.get_size():
-            self.original_image = self.create_tiled_surface()
-            self.original_image = premul_alpha_surface(self.original_image.convert_alpha())
-            if self.original_image is None:
+        if self.rect.size != self._tiled_size:
+            if self._pending_image is not None:
+                self._pending_image.cancel()
+                self._pending_image = None
+            self._tiled_size = self.rect.size
+            # Sizes seen recently are still in the cache, no need to involve the worker
+            cached_surface = self._cached_tiled_surface(self._tiled_size, self._tile)
+            if cached_surface is not None:
+                self.original_image = cached_surface
+                self.set_image(self.original_image)
+                return
+            self._pending_image = _tiling_executor.submit(self._build_tiled_image, self._tiled_size,
+                                                          self._tile, self._tile_pm)
+            # Stretch the current image to fill in until the worker has built the real one
+            current_image = self.original_image
+            if current_image is None:
                 if self._pre_clipped_image is not None:
-                    self.original_image = self._pre_clipped_image
+                    current_image = self._pre_clipped_image
                 else:
-                    self.original_image = self.image
-            # self.set_image(pygame.transform.smoothscale(self.original_image, self.rect.size))
-            self.set_image(self.original_image)
+                    current_image = self.image
+            self.set_image(pygame.transform.scale(current_image, self.rect.size))
+
+    def update(self, time_delta: float):
+        """
+        Swaps in the tiled image once the worker has finished building it, and posts a
+        UI_IMAGE_TILED_UPDATED event so the change gets drawn.
+
+        :param time_delta: The time in seconds between calls to update.
+
+        """
+        super().update(time_delta)
+        if self._pending_image is not None and self._pending_image.done():
+            pending_image, self._pending_image = self._pending_image, None
+            if not pending_image.cancelled():
+                self.original_image = pending_image.result()
+                self.set_image(self.original_image)
+                pygame.event.post(pygame.event.Event(UI_IMAGE_TILED_UPDATED,
+                                                     {'ui_element': self,
+                                                      'ui_object_id': self.most_specific_combined_id}))